@@ -19,6 +19,7 @@ Features:
 import tkinter as tk
 from tkinter import font as tkfont
 import threading
+import sys
 import requests
 import json
 import datetime
@@ -26,12 +27,26 @@ import signal
 import pathlib
 import argparse
 import time
+import math
+import traceback
 import os # Added os import for record_live_feed
+import functools
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from copy import deepcopy
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor # NEW: For cleaner thread management
 
+try:
+    import orjson # Optional: C-accelerated JSON parsing for StatsAPI payloads
+except ImportError:
+    orjson = None
+
+def decode_json(raw):
+    """Parses JSON bytes/str with orjson when installed, else the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # -------------------------
 # Defaults
 # -------------------------
@@ -53,6 +68,13 @@ DEFAULT_CONFIG = {
     "debug": False
 }
 
+# detailedState values for a finished / live game. Interned, as is every schedule
+# detailedState on ingest, so a match compares by identity.
+FINAL_STATES = frozenset(map(sys.intern, ("Final", "Game Over")))
+IN_PROGRESS = sys.intern("In Progress")
+# Past-start games in these states (optionally followed by ": <reason>") are not about to begin
+NOT_STARTING_PREFIXES = ("Postponed", "Cancelled", "Suspended", "Completed Early")
+
 # -------------------------
 # CLI
 # -------------------------
@@ -76,13 +98,29 @@ _last_record_time = None
 # Config loader
 # -------------------------
 def load_config(path):
-    cfg = deepcopy(DEFAULT_CONFIG)
+    """Returns the merged config; re-parses the file only when its mtime changes.
+
+    The result is a shallow copy of the cached config: top-level keys may be
+    reassigned, but the nested sections are shared and must be treated as read-only.
+    """
+    p = pathlib.Path(path)
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    # Callers only set top-level keys (e.g. "debug"), so a shallow copy keeps the cache clean
+    return dict(_load_config_cached(str(p), mtime_ns))
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path, mtime_ns):
+    # Defaults are only ever one level deep: copying each section dict is enough
+    cfg = {k: dict(v) if isinstance(v, dict) else v for k, v in DEFAULT_CONFIG.items()}
     p = pathlib.Path(path)
-    if not p.exists():
+    if mtime_ns is None:
         print(f"[INFO] config {path} not found; using defaults")
         return cfg
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = decode_json(p.read_bytes())
         for k, v in data.items():
             if isinstance(v, dict) and k in cfg:
                 cfg[k].update(v)
@@ -116,22 +154,43 @@ def make_session():
     retry = Retry(total=3, backoff_factor=0.6,
                   status_forcelist=(429, 500, 502, 503, 504),
                   allowed_methods=frozenset(['GET']))
-    s.mount("https://", HTTPAdapter(max_retries=retry))
+    # Small pool shared by the schedule and live-feed endpoints (same host)
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
     s.headers.update({"User-Agent": "mlbscore-final-v8/1.0"})
     return s
 
+# Single pooled session reused by every fetch so keep-alive/TLS survive between polls
+SESSION = make_session()
+
+# Conditional-GET cache for the schedule endpoint (reused on HTTP 304)
+_SCHEDULE_CACHE = {"params": None, "etag": None, "last_modified": None, "games": []}
+# Same for /feed/live: gamePk -> {"params", "etag", "last_modified", "feed"}
+_FEED_CACHE = {}
+# Both executor workers can fetch feeds (speculative + real), so writes take the lock
+_FEED_CACHE_LOCK = threading.Lock()
+# Entries kept: the polled game plus one more, so a late fetch for the previous
+# gamePk at a game switchover can't evict the new game's validators
+_FEED_CACHE_SIZE = 2
+
+# gameDate strings repeat across polls (overlapping window); datetimes are immutable
+@functools.lru_cache(maxsize=512)
 def parse_iso_to_local(dtstr):
     if not dtstr:
         return None
     try:
-        # Using fromisoformat handles 'Z' implicitly with +00:00 replacement logic.
-        dt = datetime.datetime.fromisoformat(dtstr.replace("Z", "+00:00"))
+        if len(dtstr) == 20 and dtstr[10] == "T" and dtstr[19] == "Z":
+            # StatsAPI's fixed "YYYY-MM-DDTHH:MM:SSZ" shape: slice the fields directly
+            dt = datetime.datetime(int(dtstr[0:4]), int(dtstr[5:7]), int(dtstr[8:10]),
+                                   int(dtstr[11:13]), int(dtstr[14:16]), int(dtstr[17:19]),
+                                   tzinfo=datetime.timezone.utc)
+        else:
+            # Using fromisoformat handles 'Z' implicitly with +00:00 replacement logic.
+            dt = datetime.datetime.fromisoformat(dtstr.replace("Z", "+00:00"))
         return dt.astimezone()
     except Exception:
         return None
 
-def fetch_schedule(team_id=TEAM_ID, lookahead=LOOKAHEAD_DAYS):
-    sess = make_session()
+def fetch_schedule(team_id=TEAM_ID, lookahead=LOOKAHEAD_DAYS, hydrate="team,linescore"):
     # Use date.today() for simplicity
     today = datetime.date.today()
     start = today - datetime.timedelta(days=1)
@@ -142,36 +201,155 @@ def fetch_schedule(team_id=TEAM_ID, lookahead=LOOKAHEAD_DAYS):
         "teamId": team_id,
         "startDate": start.strftime("%Y-%m-%d"),
         "endDate": end.strftime("%Y-%m-%d"),
-        "hydrate": "team,linescore"
+        "hydrate": hydrate
     }
+    headers = {}
+    cache = _SCHEDULE_CACHE
+    # Validators only apply to the exact same query (the date window rolls daily)
+    if cache["params"] == params:
+        if cache["etag"]:
+            headers["If-None-Match"] = cache["etag"]
+        if cache["last_modified"]:
+            headers["If-Modified-Since"] = cache["last_modified"]
     try:
-        r = sess.get(url, params=params, timeout=12)
+        r = SESSION.get(url, params=params, headers=headers, timeout=12)
+        if r.status_code == 304:
+            # Unchanged: skip the JSON parse and date handling entirely
+            return list(cache["games"])
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r.content)
     except Exception as e:
         if DEBUG:
             print(f"[DEBUG] fetch_schedule error: {e}")
         return []
-    games = []
+    # Decorate with the parsed date while extracting; undated games sort last
+    # (a naive datetime.max can't be compared with the tz-aware game dates)
+    decorated = []
     for d in data.get("dates", []):
         for g in d.get("games", []):
+            status = g.get("status")
+            if isinstance(status, dict) and isinstance(status.get("detailedState"), str):
+                status["detailedState"] = sys.intern(status["detailedState"])
             gd = parse_iso_to_local(g.get("gameDate"))
             if gd:
                 g["gameDate_dt"] = gd
-            games.append(g)
-    return sorted(games, key=lambda g: g.get("gameDate_dt") or datetime.datetime.max)
-
-def fetch_live_feed(gamePk):
+                # UTC epoch seconds, so the per-poll classification is a float compare
+                g["_gd_utc_ts"] = gd.timestamp()
+            decorated.append(((gd is None, gd), g))
+    decorated.sort(key=itemgetter(0))
+    games = [g for _, g in decorated]
+    cache["params"] = params
+    cache["etag"] = r.headers.get("ETag")
+    cache["last_modified"] = r.headers.get("Last-Modified")
+    cache["games"] = games
+    return list(games)
+
+# Every key the scoreboard and recorder read from /feed/live. StatsAPI's "fields"
+# filter matches key names at any depth, so this trims the payload to those paths.
+LIVE_FEED_FIELDS = ",".join((
+    "gameData", "teams", "away", "home", "id", "name", "teamName", "status", "detailedState", "venue",
+    "liveData", "linescore", "currentInning", "inningHalf", "inningState", "outs", "innings", "num",
+    "runs", "hits", "errors", "offense", "first", "second", "third", "team", "fullName",
+    "plays", "currentPlay", "count", "balls", "strikes", "matchup", "batter", "pitcher",
+    "runners", "baseRunners", "movement", "start", "end",
+))
+
+# Key paths into the /feed/live document, walked with dig()
+_CURRENT_PLAY = ("liveData", "plays", "currentPlay")
+_LINESCORE = ("liveData", "linescore")
+
+def dig(d, path):
+    """Walks a tuple of keys through nested dicts; None as soon as a level is missing."""
+    for key in path:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(key)
+    return d
+
+def classify_games(games, now_ts):
+    """Splits a date-sorted schedule into (live_game, last_game, next_game) as of now_ts.
+
+    A game whose start time has passed but that is neither In Progress nor Final
+    (Pre-Game, Warmup, Delayed Start, ...) is still about to start, so it stays the
+    next game rather than being skipped in favour of a later one.
+    """
+    live_game = None
+    last_game = None
+    next_game = None
+    last_ts = None
+    final_states = FINAL_STATES
+
+    for g in games:
+        state = g.get("status", {}).get("detailedState", "") or ""
+        # Identify the single currently live game; it decides everything else
+        if state == IN_PROGRESS:
+            live_game = g
+            break
+
+        ts = g.get("_gd_utc_ts")
+        if ts is None:
+            continue
+        if state in final_states:
+            # Keep the most recent "finished" game
+            if ts <= now_ts and (last_ts is None or ts >= last_ts):
+                last_game = g
+                last_ts = ts
+        elif next_game is None and (ts > now_ts or not state.startswith(NOT_STARTING_PREFIXES)):
+            # Games are sorted, so the first future (or pending-start) game is the next one
+            next_game = g
+
+    return live_game, last_game, next_game
+
+def smart_poll_interval(next_game, now_ts, poll_live, poll_scheduled, poll_none):
+    """Seconds until the next poll when no game is live, from the next game's start time."""
+    if not next_game or next_game.get("_gd_utc_ts") is None:
+        # No next game found
+        return poll_none
+    # Same clock reading the schedule scan used; no datetime arithmetic needed
+    time_to_next = next_game["_gd_utc_ts"] - now_ts
+    one_hour = 3600
+    if time_to_next <= 0:
+        # Start time has passed but the game isn't live yet (warmup, delayed start)
+        return poll_live
+    if time_to_next > one_hour:
+        # Wait until 1 hour before start
+        return int(max(poll_scheduled, time_to_next - one_hour))
+    # 1 hour or less away: poll at the scheduled rate (5 min default), halving the
+    # remaining wait near first pitch so the flip to live is seen within ~live rate
+    return max(poll_live, min(poll_scheduled, int(time_to_next / 2)))
+
+def fetch_live_feed(gamePk, fields=None):
     if not gamePk:
         return None
 
-    sess = make_session()
     # Using f-string for URL
     url = f"https://statsapi.mlb.com/api/v1.1/game/{gamePk}/feed/live"
+    params = {"fields": fields} if fields else None
+    headers = {}
+    with _FEED_CACHE_LOCK:
+        cache = _FEED_CACHE.get(gamePk)
+    if cache and cache["params"] == params:
+        if cache["etag"]:
+            headers["If-None-Match"] = cache["etag"]
+        if cache["last_modified"]:
+            headers["If-Modified-Since"] = cache["last_modified"]
     try:
-        r = sess.get(url, timeout=12)
+        r = SESSION.get(url, params=params, headers=headers, timeout=12)
+        if r.status_code == 304:
+            return cache["feed"]
         r.raise_for_status()
-        return r.json()
+        feed = decode_json(r.content)
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if etag or last_modified:
+            with _FEED_CACHE_LOCK:
+                # Re-insert as newest, then drop the oldest other games beyond the limit
+                _FEED_CACHE.pop(gamePk, None)
+                _FEED_CACHE[gamePk] = {"params": params, "etag": etag,
+                                       "last_modified": last_modified, "feed": feed}
+                while len(_FEED_CACHE) > _FEED_CACHE_SIZE:
+                    del _FEED_CACHE[next(iter(_FEED_CACHE))]
+        return feed
     except Exception as e:
         if DEBUG:
             print(f"[DEBUG] fetch_live_feed error: {e}")
@@ -201,8 +379,8 @@ def record_live_feed(feed, game_info=None, full=False):
 
     try:
         # Extract key fields
-        linescore = feed.get("liveData", {}).get("linescore", {})
-        current_play = feed.get("liveData", {}).get("plays", {}).get("currentPlay", {})
+        linescore = dig(feed, _LINESCORE) or {}
+        current_play = dig(feed, _CURRENT_PLAY) or {}
         matchup = current_play.get("matchup", {})
 
         now = datetime.datetime.now()
@@ -260,6 +438,8 @@ def record_live_feed(feed, game_info=None, full=False):
 
     except Exception as e:
         print(f"[ERROR] Failed to record feed: {e}")
+        if DEBUG:
+            traceback.print_exc()
         
     # Redundant second recording block removed for cleanup.
 
@@ -275,39 +455,109 @@ def get_team_name(entry):
         return entry.get("name") or entry.get("teamName") or str(entry)
     return str(entry)
 
+def get_team_id(entry):
+    if isinstance(entry, dict):
+        if "team" in entry and isinstance(entry["team"], dict):
+            return entry["team"].get("id")
+        return entry.get("id")
+    return None
+
+def entity_id(ent):
+    """id of a feed person/team entry ({"id": ..., "fullName": ...}); non-dict values pass through."""
+    if isinstance(ent, dict):
+        return ent.get("id")
+    return ent
+
+# Normalized StatsAPI base spellings (movement.start/end, offense keys) -> diamond key
+_BASE_KEY = {
+    "1": "1B", "1b": "1B", "first": "1B", "firstbase": "1B",
+    "2": "2B", "2b": "2B", "second": "2B", "secondbase": "2B",
+    "3": "3B", "3b": "3B", "third": "3B", "thirdbase": "3B",
+    "home": "Home", "homeplate": "Home", "plate": "Home",
+}
+
+def to_base_key(v):
+    """Maps a base value from the feed to "1B"/"2B"/"3B"/"Home" (None if unknown/empty)."""
+    if not v:
+        return None
+    return _BASE_KEY.get(str(v).lower().replace(" ", ""))
+
+# Lowercased name index for the case-insensitive fallback
+_TEAM_COLORS_LC = {k.lower(): v for k, v in TEAM_COLORS.items() if isinstance(v, dict)}
+
+@functools.lru_cache(maxsize=64)
 def team_color_for(name):
     if not name:
         return (CANVAS_CFG.get("bg_color", "#000000"), CANVAS_CFG.get("accent", "#FFFFFF"))
     tc = TEAM_COLORS.get(name)
+    if not isinstance(tc, dict):
+        # Case-insensitive fallback lookup
+        tc = _TEAM_COLORS_LC.get(name.lower())
     if isinstance(tc, dict):
         prim = tc.get("primary", CANVAS_CFG.get("bg_color", "#000000"))
         acc = tc.get("accent", CANVAS_CFG.get("accent", "#FFFFFF"))
         return (prim, acc)
-    # Case-insensitive fallback lookup
-    for k, v in TEAM_COLORS.items():
-        if k.lower() == name.lower() and isinstance(v, dict):
-            return (v.get("primary", CANVAS_CFG.get("bg_color")), v.get("accent", CANVAS_CFG.get("accent")))
     return (CANVAS_CFG.get("bg_color", "#000000"), CANVAS_CFG.get("accent", "#FFFFFF"))
 
+# StatsAPI team id -> (primary, accent); ids are stable across display-name changes
+TEAM_COLORS_BY_ID = {
+    tid: team_color_for(name)
+    for name, tid in CONFIG.get("teams", {}).items()
+    if isinstance(TEAM_COLORS.get(name), dict)
+}
+
+@functools.lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip("#")
     # Added error handling for bad hex format
     if len(hex_color) != 6:
         return (0, 0, 0)
     try:
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        # One parse of all three channels; rejects anything but hex digits
+        r, g, b = bytes.fromhex(hex_color)
     except ValueError:
         return (0, 0, 0)
-
-def rgb_to_hex(rgb):
-    return "#{:02x}{:02x}{:02x}".format(*[max(0, min(255, int(x))) for x in rgb])
+    return (r, g, b)
+
+# B/S/O rows: (kind, label, dots drawn, row offset in spacing units); only two outs are drawn
+BSO_ROWS = (
+    ("balls", "BALLS", 3, -1),
+    ("strikes", "STRIKES", 2, 1),
+    ("outs", "OUTS", 2, 3),
+)
+
+def bso_color(kind, value):
+    """Fill for the lit dots of a B/S/O row holding value."""
+    if value is None:
+        return "#7f8c8d"
+    if kind == "outs":
+        if 1 <= value <= 2:
+            return "#e74c3c"
+        return "#00a651" if value == 0 else "#2c3e50"
+    if kind == "balls":
+        if value == 3:
+            return "#e74c3c"
+    if kind == "strikes":
+        if value == 2:
+            return "#e74c3c"
+    return "#f1c40f" if value > 0 else "#00a651"
+
+# Frame intervals of the shared base-fade and runner-tween tickers (ms)
+FADE_TICK_MS = 75
+RUNNER_TICK_MS = 30
 
 # Simplified color blend
 def blend_colors(c1, c2, t):
-    rgb1 = hex_to_rgb(c1)
-    rgb2 = hex_to_rgb(c2)
-    blended = [int(r1 + (r2 - r1) * t) for r1, r2 in zip(rgb1, rgb2)]
-    return rgb_to_hex(blended)
+    return blend_rgb(hex_to_rgb(c1), hex_to_rgb(c2), t)
+
+def blend_rgb(rgb1, rgb2, t):
+    """blend_colors on already-parsed (r, g, b) int tuples; returns a hex string."""
+    r1, g1, b1 = rgb1
+    r2, g2, b2 = rgb2
+    # t in 1/1024ths, so each channel is an integer multiply-add and shift
+    ti = int(t * 1024)
+    tj = 1024 - ti
+    return "#%02x%02x%02x" % ((r1 * tj + r2 * ti) >> 10, (g1 * tj + g2 * ti) >> 10, (b1 * tj + b2 * ti) >> 10)
 
 # -------------------------
 # GUI App
@@ -317,6 +567,10 @@ class ScoreboardApp:
         self.root = root
         self.team_id = TEAM_ID
         self.polling = POLLING
+        # poll intervals (seconds) resolved once instead of per poll
+        self._poll_live = int(self.polling.get("live", 15))
+        self._poll_scheduled = int(self.polling.get("scheduled", 300))
+        self._poll_none = int(self.polling.get("none", 3600))
         self.debug = DEBUG
         self.balls = 0
         self.strikes = 0
@@ -330,10 +584,18 @@ class ScoreboardApp:
         self.fg = CANVAS_CFG.get("fg_color", "#eaeaea")
         self.accent = CANVAS_CFG.get("accent", "#FFD700")
         self.font_family = CANVAS_CFG.get("font_family", "Courier")
+        self.max_innings_cfg = UI_CFG.get("max_innings", 9)
+        # highlight for the active inning's header cell (constant for the app's colors)
+        self.header_active_bg = blend_colors(self.accent, self.bg, 0.9)
 
         self.canvas = tk.Canvas(root, width=self.width, height=self.height,
                                 bg=self.bg, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
+        # Deiconifying maps the toplevel, not the already-mapped canvas, so listen on root
+        self.root.bind("<Map>", lambda e: self._redraw_if_skipped())
+        # raw Tcl entry point and widget path for the hot itemconfigure/move paths
+        self._tkcall = self.canvas.tk.call
+        self._cpath = str(self.canvas)
 
         # fonts
         self.font_title = tkfont.Font(family=self.font_family, size=18, weight="bold")
@@ -342,8 +604,11 @@ class ScoreboardApp:
         self.font_small = tkfont.Font(family=self.font_family, size=10)
         self.font_status = tkfont.Font(family=self.font_family, size=12, weight="bold")
 
-        # ThreadPoolExecutor for network operations
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        # ThreadPoolExecutor for network operations; its worker threads are reused for every
+        # poll, and the pending Future doubles as the "fetch in flight" guard. The second
+        # worker lets fetch_and_schedule overlap the live-feed request with the schedule.
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self._fetch_future = None
 
         # state
         self.games = []
@@ -351,9 +616,11 @@ class ScoreboardApp:
         self.next_game = None
         self.live_game = None
         self.live_feed = None
-        self.poll_interval = self.polling.get("none", 3600)
+        self._last_live_pk = None
+        self.poll_interval = self._poll_none
         self.next_update_in = 0
-        self.running_fetch = False
+        # time.monotonic() at which the next poll is due (0 = poll immediately)
+        self._deadline = 0
 
         # base state
         self.bases = {
@@ -362,6 +629,8 @@ class ScoreboardApp:
             "3B": {"occupied": False, "team": None, "anim": None},
         }
         self.empty_base_fill = "#d0d0d0"
+        # pending after() id of the shared fade ticker (None when no fade is running)
+        self._fade_after = None
 
         # runner animation state
         # rkey -> {"cid": tk_id, "base": "1B", "color": "#HEX"}
@@ -369,10 +638,18 @@ class ScoreboardApp:
         # "1B" -> rkey
         self.runners_by_base = {} 
         self._next_runner_key = 1
+        # ovals of scored runners still playing their shrink animation
+        self._shrinking_cids = set()
+        # active runner tweens ([i, steps, frame, done]) and the shared ticker's after() id
+        self._tweens = []
+        self._tween_after = None
 
         self.current_batter = "Batter: -"
         self.current_pitcher = "Pitcher: -"
 
+        # Flat snapshot of everything render() draws, rebuilt once per fetch
+        self._render_model = None
+
         # followed team name
         self.followed_team_name = None
         for name, tid in CONFIG.get("teams", {}).items():
@@ -395,17 +672,44 @@ class ScoreboardApp:
         self.score_start_x = 320
         self.col_width = 44
         self.row_height = 42
-        self.diamond_cx = None
-        self.diamond_cy = None
-        self.diamond_ds = None
+        self.y_away = self.top_margin + self.row_height
+        self.y_home = self.y_away + self.row_height
+        # Diamond geometry only depends on the constants above
+        self.diamond_cx = self.left_margin + 180
+        self.diamond_cy = self.y_home + self.row_height + 140
+        self.diamond_ds = 120
         self.base_positions = {}
-
-        # initial loop
-        self.root.after(100, self.update_loop)
+        self.compute_base_positions()
+        # column centers and cell left/right edges (innings + R/H/E + icon) as ints,
+        # recomputed only when max_innings changes
+        self._col_x = []
+        self._col_x1 = []
+        self._col_x2 = []
+        # persistent layout items: key -> canvas id, plus last pushed option values
+        self._items = {}
+        self._drawn = {}
+        # per-row (rect_id, text_id) pairs for the inning cells, indexed [side][inning],
+        # and every value text id of the row (innings then R/H/E) in model "_vals" order
+        self.cell_ids = {"away": [], "home": []}
+        self.text_ids = {"away": [], "home": []}
+        # batting-side -> bat icon position, filled by build_layout
+        self._icon_pos = {}
+        self._layout_key = None
+        # set while an after_idle render is pending
+        self._dirty = False
+        # set when render() bailed out while minimized; replayed on <Map> / next tick
+        self._render_skipped = False
+
+        # initial loop (token kept so there is only ever one pending update_loop);
+        # it runs as soon as the mainloop idles, so the first fetch starts right away
+        self._after_id = self.root.after_idle(self.update_loop)
+        self.root.after(60000, self.sweep_runner_items)
 
         # limited debug trackers
-        self._last_poll_time = 0
+        self._last_poll_time = float("-inf")
         self._last_runner_state = {}
+        # fingerprint of the last currentPlay the base/runner pipeline processed
+        self._last_play_sig = None
         self._last_log_state = None
 
     def log(self, *args, verbose=False, level="info"):
@@ -421,6 +725,11 @@ class ScoreboardApp:
             if self.debug or str(level).lower() == "info":
                 print(f"[{str(level).upper()}]", *args)
 
+    def dlog(self, fmt, *args):
+        """Debug-only logging; the message is only formatted when debug is on."""
+        if self.debug:
+            print("[DEBUG]", fmt % args if args else fmt)
+
     # runner helpers
     def compute_base_positions(self):
         """Calculates base coordinates relative to the diamond center."""
@@ -428,7 +737,7 @@ class ScoreboardApp:
         # Improved default positioning for robustness
         cx = self.diamond_cx or (self.left_margin + 180)
         cy = self.diamond_cy or (self.top_margin + 300)
-        inset = ds * 0.6
+        inset = int(ds * 0.6)
         self.base_positions = {
             "2B": (cx, cy - inset),
             "1B": (cx + inset, cy),
@@ -440,13 +749,12 @@ class ScoreboardApp:
         """Spawns a static runner icon at a base."""
         # Only perform GUI ops on main thread, but this is designed to be called via root.after(0, ...)
         if threading.current_thread() != threading.main_thread():
-             self.log(f"Spawn requested for {base_key} from non-main thread. Scheduling...", verbose=True)
+             self.dlog("Spawn requested for %s from non-main thread. Scheduling...", base_key)
              self.root.after(0, lambda: self.spawn_runner_at_base(base_key, color))
              return
 
         if base_key == "Home" or base_key in self.runners_by_base:
             return None
-        self.compute_base_positions()
         pos = self.base_positions.get(base_key)
         if pos is None:
             return None
@@ -456,17 +764,17 @@ class ScoreboardApp:
         self._next_runner_key += 1
         # Runner is a simple circle on the canvas
         cid = self.canvas.create_oval(bx - 8, by - 8, bx + 8, by + 8,
-                                      fill=color, outline="white", width=2)
+                                      fill=color, outline="white", width=2, tags="runner")
         self.runners[rkey] = {"cid": cid, "base": base_key, "color": color}
         self.runners_by_base[base_key] = rkey
-        self.log(f"Runner spawned: {rkey} at {base_key}", verbose=True)
+        self.dlog("Runner spawned: %s at %s", rkey, base_key)
         return rkey
 
     def move_runner_base(self, from_base, to_base, color=None, steps=12):
         """Handles runner movement with animation and base state updates."""
         # Only perform GUI ops on main thread, but this is designed to be called via root.after(0, ...)
         if threading.current_thread() != threading.main_thread():
-             self.log(f"Move requested for {from_base} to {to_base} from non-main thread. Scheduling...", verbose=True)
+             self.dlog("Move requested for %s to %s from non-main thread. Scheduling...", from_base, to_base)
              self.root.after(0, lambda: self.move_runner_base(from_base, to_base, color, steps))
              return
 
@@ -474,26 +782,21 @@ class ScoreboardApp:
         runner = self.runners.get(rkey)
 
         if not rkey or not runner:
-            self.log(f"Move requested from {from_base} but no runner found/present.", verbose=True)
+            self.dlog("Move requested from %s but no runner found/present.", from_base)
             if to_base != "Home":
                 # Fallback: if a runner was missed/wasn't animated, ensure it's at the destination
                 return self.spawn_runner_at_base(to_base, color=color or self.accent)
             return None
 
-        self.compute_base_positions()
         start = self.base_positions.get(from_base)
         end = self.base_positions.get(to_base)
         color = runner.get("color", self.accent)
-
-        # Clear old canvas object and pop runner from self.runners immediately
-        try:
-            self.canvas.delete(runner["cid"])
-        except Exception:
-            pass
-        self.runners.pop(rkey, None) # Runner is now represented by the animation object
+        cid = runner["cid"]
 
         if not start or not end:
             self.log(f"Error: Base positions unknown for {from_base} or {to_base}. Spawning at destination.", level="error")
+            self.canvas.delete(cid)
+            self.runners.pop(rkey, None)
             if to_base != "Home":
                 return self.spawn_runner_at_base(to_base, color=color)
             return None
@@ -503,48 +806,74 @@ class ScoreboardApp:
         dx = (tx - sx) / float(steps)
         dy = (ty - sy) / float(steps)
 
-        # Create the temporary moving object
-        temp_cid = self.canvas.create_oval(sx - 8, sy - 8, sx + 8, sy + 8, fill=color, outline="white", width=2)
+        # The runner's own oval is animated; it is detached from from_base until it lands
+        def _frame(i):
+            if rkey not in self.runners:
+                # Runners were cleared mid-animation (e.g. third out)
+                return False
+            self._tkcall(self._cpath, "move", cid, dx, dy)
 
-        def _step(i=0):
-            if i >= steps:
-                self.canvas.delete(temp_cid)
-                if to_base != "Home":
-                    # Spawn the static runner at the new base
-                    new_key = self.spawn_runner_at_base(to_base, color=color)
-                    self.log(f"Runner moved: {rkey} {from_base} -> {to_base} as {new_key}", verbose=True)
-                else:
-                    # Runner scored, do the fade out animation
-                    shrink_id = self.canvas.create_oval(tx - 8, ty - 8, tx + 8, ty + 8, fill=color, outline="white", width=2)
-                    def _shrink(step=0, maxs=6):
-                        if step >= maxs:
-                            try:
-                                self.canvas.delete(shrink_id)
-                            except Exception:
-                                pass
-                            return
-                        scale = 1 - (step / float(maxs))
-                        w = int(8 * scale)
-                        self.canvas.coords(shrink_id, tx - w, ty - w, tx + w, ty + w)
-                        self.root.after(40, lambda: _shrink(step + 1, maxs))
-                    _shrink()
-                    self.log(f"Runner {rkey} scored at Home", verbose=True)
-                # Force a full render to reflect the new state (e.g., cleared base/runner)
-                self.render_full_gui()
+        def _land():
+            if rkey not in self.runners:
                 return
-
-            try:
-                self.canvas.move(temp_cid, dx, dy)
-            except Exception:
-                # Handle error if canvas object is deleted mid-animation
-                pass
-            
-            # Always schedule GUI updates using self.root.after in animation
-            self.root.after(30, lambda: _step(i + 1))
-
-        _step()
+            if to_base != "Home" and to_base not in self.runners_by_base:
+                # Snap onto the new base and keep the same canvas item
+                self.canvas.coords(cid, tx - 8, ty - 8, tx + 8, ty + 8)
+                runner["base"] = to_base
+                self.runners_by_base[to_base] = rkey
+                self.dlog("Runner moved: %s %s -> %s", rkey, from_base, to_base)
+            else:
+                # Runner scored (or the base is already taken): shrink the oval away
+                self.runners.pop(rkey, None)
+                self._shrinking_cids.add(cid)
+                maxs = 6
+                def _shrink(step):
+                    w = int(8 * (1 - step / float(maxs)))
+                    self.canvas.coords(cid, tx - w, ty - w, tx + w, ty + w)
+                def _gone():
+                    self.canvas.delete(cid)
+                    self._shrinking_cids.discard(cid)
+                self._add_tween(maxs, _shrink, _gone)
+                if to_base == "Home":
+                    self.dlog("Runner %s scored at Home", rkey)
+            # Force a full render to reflect the new state (e.g., cleared base/runner)
+            self.render_full_gui()
+
+        self._add_tween(steps, _frame, _land)
         return rkey
 
+    def _add_tween(self, steps, frame, done=None):
+        """Registers a runner animation on the shared ticker (main thread).
+
+        frame(i) runs once per tick for i in range(steps) and may return False
+        to cancel; done() runs on the tick after the last frame.
+        """
+        self._tweens.append([0, steps, frame, done])
+        if self._tween_after is None:
+            self._tween_after = self.root.after(0, self._tween_tick)
+
+    def _tween_tick(self):
+        """Advances every active runner tween by one frame; reschedules itself while any remain."""
+        pending = iter(self._tweens)
+        # done() callbacks may register follow-up tweens (e.g. the shrink after a score)
+        self._tweens = []
+        try:
+            for tw in pending:
+                i, steps, frame, done = tw
+                if i >= steps:
+                    if done:
+                        done()
+                    continue
+                if frame(i) is False:
+                    continue
+                tw[0] = i + 1
+                self._tweens.append(tw)
+        finally:
+            # A tween that raised is dropped; the rest keep running and the ticker is
+            # always rescheduled or cleared, so later _add_tween calls can restart it
+            self._tweens.extend(pending)
+            self._tween_after = self.root.after(RUNNER_TICK_MS, self._tween_tick) if self._tweens else None
+
     def clear_all_runners(self):
         """Clears all runner icons from the canvas."""
         # Must be called on the main thread
@@ -559,14 +888,51 @@ class ScoreboardApp:
                 pass
         self.runners.clear()
         self.runners_by_base.clear()
-        self.log("All runners cleared", verbose=True)
+        for base in self.bases.values():
+            base["anim"] = None
+        self.dlog("All runners cleared")
+
+    def clear_runner_at_base(self, base_key):
+        """Removes the runner icon from a vacated base and drops its fade (main thread)."""
+        rkey = self.runners_by_base.pop(base_key, None)
+        info = self.runners.pop(rkey, None) if rkey else None
+        if info:
+            self.canvas.delete(info["cid"])
+        if base_key in self.bases:
+            self.bases[base_key]["anim"] = None
+
+    def sweep_runner_items(self):
+        """Deletes runner-tagged canvas items no longer owned by a runner (runs every minute)."""
+        owned = {info["cid"] for info in self.runners.values()} | self._shrinking_cids
+        stale = [cid for cid in self.canvas.find_withtag("runner") if cid not in owned]
+        if stale:
+            self.canvas.delete(*stale)
+            self.dlog("Swept %d stale runner item(s)", len(stale))
+        self.root.after(60000, self.sweep_runner_items)
 
     def render_full_gui(self):
-        """Wrapper to ensure full render is called on the main thread."""
+        """Wrapper to ensure render is requested from the main thread."""
         if threading.current_thread() != threading.main_thread():
              self.root.after(0, self.render_full_gui)
              return
-        self.render(full=True)
+        self._request_redraw()
+
+    def _request_redraw(self):
+        """Marks the canvas dirty and coalesces repaints into one idle callback (main thread)."""
+        if self._dirty:
+            return
+        self._dirty = True
+        self.root.after_idle(self._flush_redraw)
+
+    def _redraw_if_skipped(self):
+        """<Map> handler: replays a render that was skipped while the window was hidden."""
+        if self._render_skipped:
+            self._request_redraw()
+
+    def _flush_redraw(self):
+        """Performs the single pending render queued by _request_redraw."""
+        self._dirty = False
+        self.render()
 
     def format_seconds_to_dhms_string(self, seconds):
         """Formats an integer number of seconds into '$days, HH:MM:SS' string."""
@@ -581,28 +947,13 @@ class ScoreboardApp:
         time_part = f"{hours:02}:{minutes:02}:{secs:02}"
         return f"{td.days}d, {time_part}" if td.days > 0 else time_part
 
-    # rendering
-    def render(self, full=True):
-        """Main rendering function (must be called on main thread)."""
-        if threading.current_thread() != threading.main_thread():
-            self.log("render() called from non-main thread!", level="error")
-            return
-
-        if full:
-            self.canvas.delete("all")
-        else:
-            # Using specific tag for footer
-            self.canvas.delete("footer")
-            # Clear BSO to prevent flicker if a state change happens fast
-            self.canvas.delete("bso_group") 
-            # Clear base diamond to redraw occupants
-            self.canvas.delete("diamond_bases") 
-
+    def build_render_model(self):
+        """Flattens feed/schedule data into the values render() needs (runs on the fetch thread)."""
         game_src = None
         linescore = {}
         if self.live_feed:
             game_src = self.live_feed.get("gameData", {}) or {}
-            linescore = self.live_feed.get("liveData", {}).get("linescore", {}) or {}
+            linescore = dig(self.live_feed, _LINESCORE) or {}
         elif self.last_game:
             game_src = self.last_game
             linescore = self.last_game.get("linescore", {}) or {}
@@ -611,351 +962,460 @@ class ScoreboardApp:
             linescore = self.next_game.get("linescore", {}) or {}
 
         if not game_src:
-            msg = f"Waiting for game data for {self.followed_team_name}"
-            self.canvas.create_text(self.width // 2, self.height // 2,
-                                    text=msg, font=self.font_title, fill=self.fg)
-            time_display = self.format_seconds_to_dhms_string(self.next_update_in)
-            footer = f"{msg} | Next update in: {time_display}"
-            self.canvas.create_text(self.width // 2, self.height - 20,
-                                    text=footer, font=self.font_small, fill=self.accent, tags="footer")
-            return
-            
-        # Get current inning index for highlighting
+            return None
+
+        teams = game_src.get("teams", {}) or {}
+        away_entry = teams.get("away", {})
+        home_entry = teams.get("home", {})
+        away = get_team_name(away_entry)
+        home = get_team_name(home_entry)
+        # Prefer the id-keyed table; fall back to the name lookup for unknown ids
+        away_bg, away_fg = TEAM_COLORS_BY_ID.get(get_team_id(away_entry)) or team_color_for(away)
+        home_bg, home_fg = TEAM_COLORS_BY_ID.get(get_team_id(home_entry)) or team_color_for(home)
+        innings = linescore.get("innings", []) or []
+        teams_ls = linescore.get("teams", {}) or {}
+        max_innings = max(len(innings), self.max_innings_cfg)
+        # One flat list of display strings per row: every inning (padded to the
+        # full grid width) followed by R/H/E, in the same order as text_ids
+        padding = ["-"] * (max_innings - len(innings))
+        away_ls = teams_ls.get("away") or {}
+        home_ls = teams_ls.get("home") or {}
+        away_vals = ([str((inn.get("away") or {}).get("runs", "-")) for inn in innings] + padding
+                     + [str(away_ls.get(key, "-")) for key in ("runs", "hits", "errors")])
+        home_vals = ([str((inn.get("home") or {}).get("runs", "-")) for inn in innings] + padding
+                     + [str(home_ls.get(key, "-")) for key in ("runs", "hits", "errors")])
+
         active_inning_idx = -1
+        batting_side = None
+        is_live = False
         if self.live_feed:
-            ls = self.live_feed.get("liveData", {}).get("linescore", {}) or {}
-            active_inning_idx = ls.get("currentInning", 0) - 1
+            active_inning_idx = (linescore.get("currentInning") or 0) - 1
+            inning_half = str(linescore.get("inningHalf") or "").lower()
+            if inning_half == "top":
+                batting_side = "away"
+            elif inning_half == "bottom":
+                batting_side = "home"
+            # game_src is the feed's gameData here
+            state = game_src.get("status", {}).get("detailedState", "") or ""
+            is_live = "In Progress" in state or "Live" in state
+
+        # Footer context is fixed until the next poll; only the countdown is appended per tick
+        footer_prefix = ""
+        next_game = self.next_game
+        if not is_live and next_game and "gameDate_dt" in next_game:
+            # parse_iso_to_local already returns local time
+            next_dt = next_game["gameDate_dt"]
+            next_teams = next_game["teams"]
+            next_away = get_team_name(next_teams["away"])
+            next_home = get_team_name(next_teams["home"])
+            try:
+                footer_prefix = f"Next: {next_away} @ {next_home} {next_dt.strftime('%a %b %d, %I:%M %p %Z')} | "
+            except Exception:
+                footer_prefix = f"Next: {next_away} @ {next_home} | "
+        elif not is_live:
+            footer_prefix = f"Waiting for game data for {self.followed_team_name} | "
+
+        return {
+            "away_name": away,
+            "home_name": home,
+            "away_bg": away_bg,
+            "away_fg": away_fg,
+            "home_bg": home_bg,
+            "home_fg": home_fg,
+            # active inning cell backgrounds, blended here rather than on every render
+            "away_active_bg": blend_colors(away_bg, self.accent, 0.25),
+            "home_active_bg": blend_colors(home_bg, self.accent, 0.25),
+            "away_vals": away_vals,
+            "home_vals": home_vals,
+            "max_innings": max_innings,
+            "active_inning_idx": active_inning_idx,
+            "batting_side": batting_side,
+            "is_live": is_live,
+            "batter": self.current_batter,
+            "pitcher": self.current_pitcher,
+            "b": self.balls,
+            "s": self.strikes,
+            "o": self.outs,
+            "footer_prefix": footer_prefix,
+            # "bases" is filled in by _apply_poll_result on the Tk thread
+        }
 
-        away = get_team_name(game_src.get("teams", {}).get("away", {}))
-        home = get_team_name(game_src.get("teams", {}).get("home", {}))
-        innings = linescore.get("innings", []) if linescore else []
-        max_innings = max(len(innings), UI_CFG.get("max_innings", 9))
+    # rendering
+    def _add_item(self, key, cid):
+        """Registers a layout canvas item under a stable key for later itemconfigure."""
+        self._items[key] = cid
+        return cid
+
+    def _config(self, key, **opts):
+        """itemconfigure a layout item, skipping options whose value is unchanged."""
+        cid = self._items.get(key)
+        if cid is None:
+            return
+        self._config_id(cid, **opts)
+
+    def _config_id(self, cid, **opts):
+        """itemconfigure a canvas item by id, skipping options whose value is unchanged."""
+        changed = []
+        for opt, val in opts.items():
+            if self._drawn.get((cid, opt)) != val:
+                self._drawn[(cid, opt)] = val
+                changed.append("-" + opt)
+                changed.append(val)
+        if changed:
+            # Straight to Tcl: skips Tkinter's per-call option dict conversion
+            self._tkcall(self._cpath, "itemconfigure", cid, *changed)
+
+    def build_layout(self, model):
+        """Creates the static scoreboard items once (must be called on main thread).
+
+        Every item is tagged "layout" plus its own key; render() afterwards only
+        reconfigures these items instead of deleting and recreating them.
+        """
+        self.canvas.delete("layout")
+        self._items = {}
+        self._drawn = {}
+        self.cell_ids = {"away": [], "home": []}
+        self.text_ids = {"away": [], "home": []}
+        self._icon_pos = {}
+        c = self.canvas
+
+        if not model:
+            self._add_item("waiting_msg", c.create_text(self.width // 2, self.height // 2, text="",
+                                                        font=self.font_title, fill=self.fg,
+                                                        tags=("layout", "waiting_msg")))
+            self._add_item("footer", c.create_text(self.width // 2, self.height - 20, text="",
+                                                   font=self.font_small, fill=self.accent,
+                                                   tags=("layout", "footer")))
+            return
 
-        left_margin = self.left_margin
+        max_innings = model["max_innings"]
         top_margin = self.top_margin
-        team_x = left_margin
+        team_x = self.left_margin
         score_start_x = self.score_start_x
         col_width = self.col_width
         row_height = self.row_height
-
-        # Full render components
-        if full:
-            title_text = f"{self.followed_team_name} — MLB Scoreboard"
-            self.canvas.create_text(self.width // 2, 22, text=title_text, font=self.font_title, fill=self.accent)
-
-            # header team cell
-            self.canvas.create_rectangle(team_x - 8, top_margin - 18, score_start_x - 4, top_margin + 18,
-                                         fill=self.bg, outline="black")
-            self.canvas.create_text(team_x, top_margin, text="TEAM", font=self.font_header, fill=self.accent, anchor="w")
-
-            # inning header cells
+        y_away = self.y_away
+        y_home = self.y_home
+        if len(self._col_x) != max_innings + 4:
+            half = col_width // 2
+            self._col_x = [int(score_start_x + i * col_width) for i in range(max_innings + 4)]
+            self._col_x1 = [x - half for x in self._col_x]
+            self._col_x2 = [x + half for x in self._col_x]
+        col_x = self._col_x
+        col_x1 = self._col_x1
+        col_x2 = self._col_x2
+
+        title_text = f"{self.followed_team_name} — MLB Scoreboard"
+        c.create_text(self.width // 2, 22, text=title_text, font=self.font_title, fill=self.accent, tags="layout")
+
+        # header team cell
+        c.create_rectangle(team_x - 8, top_margin - 18, score_start_x - 4, top_margin + 18,
+                           fill=self.bg, outline="black", tags="layout")
+        c.create_text(team_x, top_margin, text="TEAM", font=self.font_header, fill=self.accent, anchor="w", tags="layout")
+
+        # inning header cells (fill toggled for the active inning)
+        for i in range(max_innings):
+            x_center = col_x[i]
+            key = f"inning_header_{i}"
+            self._add_item(key + "_bg", c.create_rectangle(col_x1[i], top_margin - 18, col_x2[i], top_margin + 18,
+                                                           fill=self.bg, outline="black", tags=("layout", key + "_bg")))
+            self._add_item(key, c.create_text(x_center, top_margin, text=str(i + 1), font=self.font_header,
+                                              fill=self.accent, tags=("layout", key)))
+
+        # totals headers: R, H, E, extra (bat icon column)
+        totals_labels = ("R", "H", "E", "⚾")
+        for j, label in enumerate(totals_labels):
+            x_center = col_x[max_innings + j]
+            c.create_rectangle(col_x1[max_innings + j], top_margin - 18, col_x2[max_innings + j], top_margin + 18,
+                               fill=self.bg, outline="black", tags="layout")
+            c.create_text(x_center, top_margin, text=label if label != "⚾" else "🦇", font=self.font_header,
+                          fill=self.accent, tags="layout")
+
+        # --- Clean, properly aligned grid overlay ---
+        grid_left = team_x - 8
+        grid_top = top_margin - 18
+        grid_right = col_x2[max_innings + 3]
+        grid_bottom = grid_top + row_height * 3  # header + away + home full enclosure
+
+        for x in col_x1:
+            c.create_line(x, grid_top, x, grid_bottom, fill="#38444d", width=1, tags="layout")
+
+        for j in range(3):
+            y = grid_top + (j + 1) * row_height
+            c.create_line(grid_left, y, grid_right, y, fill="#38444d", width=1, tags="layout")
+
+        c.create_rectangle(grid_left, grid_top, grid_right, grid_bottom, outline="#55606b", width=2, tags="layout")
+
+        # Diamond (static)
+        ds = self.diamond_ds
+        diamond_pts = [self.diamond_cx, self.diamond_cy - ds, self.diamond_cx + ds, self.diamond_cy,
+                       self.diamond_cx, self.diamond_cy + ds, self.diamond_cx - ds, self.diamond_cy]
+        c.create_polygon(diamond_pts, outline=self.accent, fill="#6b8f57", width=3, tags="layout")
+
+        # Team rows: name cell, per-inning cells, totals and bat icon cell
+        for y, side in ((y_away, "away"), (y_home, "home")):
+            name = model[f"{side}_name"]
+            bg_col = model[f"{side}_bg"]
+            fg_col = model[f"{side}_fg"]
+            c.create_rectangle(team_x - 8, y - 18, score_start_x - 4, y + 18, fill=bg_col, outline="black", tags="layout")
+            c.create_text(team_x, y, text=name, font=self.font_team, fill=fg_col, anchor="w", tags="layout")
+
+            row_cells = self.cell_ids[side]
+            row_texts = self.text_ids[side]
             for i in range(max_innings):
-                x_center = score_start_x + i * col_width
-                self.canvas.create_rectangle(x_center - col_width // 2, top_margin - 18,
-                                             x_center + col_width // 2, top_margin + 18,
-                                             fill=self.bg, outline="black", tags="inning_header")
-                self.canvas.create_text(x_center, top_margin, text=str(i + 1), font=self.font_header, fill=self.accent, tags="inning_header_text")
-
-            # totals headers: R, H, E, extra (bat icon column)
-            totals_labels = ("R", "H", "E", "⚾")
-            for j, label in enumerate(totals_labels):
-                x_center = score_start_x + (max_innings + j) * col_width
-                self.canvas.create_rectangle(x_center - col_width // 2, top_margin - 18,
-                                             x_center + col_width // 2, top_margin + 18,
-                                             fill=self.bg, outline="black")
-                self.canvas.create_text(x_center, top_margin, text=label if label != "⚾" else "🦇", font=self.font_header, fill=self.accent)
-
-            # --- Clean, properly aligned grid overlay ---
-            grid_left = team_x - 8
-            grid_top = top_margin - 18
-            grid_right = score_start_x + (max_innings + 3) * col_width + col_width // 2
-            grid_bottom = grid_top + row_height * 3  # header + away + home full enclosure
-
-            for i in range(max_innings + 4):
-                x = score_start_x + (i - 0.5) * col_width
-                self.canvas.create_line(x, grid_top, x, grid_bottom, fill="#38444d", width=1)
+                x_center = col_x[i]
+                key = f"inning_{side}_{i}"
+                rect_id = c.create_rectangle(col_x1[i], y - 18, col_x2[i], y + 18,
+                                             fill=bg_col, outline="black", tags=("layout", key + "_bg"))
+                text_id = c.create_text(x_center, y, text="-", font=self.font_team, fill=fg_col, tags=("layout", key))
+                row_cells.append((rect_id, text_id))
+                row_texts.append(text_id)
 
             for j in range(3):
-                y = grid_top + (j + 1) * row_height
-                self.canvas.create_line(grid_left, y, grid_right, y, fill="#38444d", width=1)
-
-            self.canvas.create_rectangle(grid_left, grid_top, grid_right, grid_bottom, outline="#55606b", width=2)
-            
-            # Diamond and bases (Static parts)
-            self.diamond_cx = self.left_margin + 180
-            self.diamond_cy = y_home + row_height + 140
-            self.diamond_ds = 120
-            ds = self.diamond_ds
-            diamond_pts = [self.diamond_cx, self.diamond_cy - ds, self.diamond_cx + ds, self.diamond_cy,
-                           self.diamond_cx, self.diamond_cy + ds, self.diamond_cx - ds, self.diamond_cy]
-            self.canvas.create_polygon(diamond_pts, outline=self.accent, fill="#6b8f57", width=3)
-        
-        # Draw team rows (colored) and per-inning values
-        def draw_team_row(y, name, side, active_idx):
-            bg_col, fg_col = team_color_for(name)
-            
-            # Redraw only the dynamic cells for non-full renders
-            if full:
-                self.canvas.create_rectangle(team_x - 8, y - 18, score_start_x - 4, y + 18, fill=bg_col, outline="black")
-                self.canvas.create_text(team_x, y, text=name, font=self.font_team, fill=fg_col, anchor="w")
-
-            for i in range(max_innings):
-                run_val = "-"
-                if innings and i < len(innings):
-                    inning = innings[i]
-                    if side == "away" and "away" in inning:
-                        run_val = inning["away"].get("runs", "-")
-                    if side == "home" and "home" in inning:
-                        run_val = inning["home"].get("runs", "-")
-                
-                x1 = score_start_x + i * col_width - col_width // 2
-                x2 = score_start_x + i * col_width + col_width // 2
-                
-                # Highlight active inning header
-                if i == active_idx:
-                    bg_fill_header = blend_colors(self.accent, self.bg, 0.9)
-                    text_fill_header = self.fg
-                    # In a full render, redraw the whole header block to ensure highlight is cleared/set
-                    if full:
-                        self.canvas.create_rectangle(x1, top_margin - 18, x2, top_margin + 18,
-                                                     fill=bg_fill_header, outline="black", tags="inning_header")
-                        self.canvas.create_text(score_start_x + i * col_width, top_margin, text=str(i + 1), 
-                                                font=self.font_header, fill=text_fill_header, tags="inning_header_text")
-                else:
-                    bg_fill_header = self.bg
-                    text_fill_header = self.accent
-                    
-                # Score cell
-                cell_bg = blend_colors(bg_col, self.accent, 0.25) if i == active_idx else bg_col
-                
-                # Use tags for dynamic elements to only redraw what's necessary (scores, totals, bat icon)
-                score_tag = f"score_{side}_{i}"
-                self.canvas.delete(score_tag)
-                self.canvas.create_rectangle(x1, y - 18, x2, y + 18, fill=cell_bg, outline="black", tags=score_tag)
-                self.canvas.create_text(score_start_x + i * col_width, y, text=str(run_val), font=self.font_team,
-                                        fill=fg_col, tags=score_tag)
-
-            # Totals
-            totals = linescore.get("teams", {}).get(side, {})
-            for j, key in enumerate(("runs", "hits", "errors")):
-                val = str(totals.get(key, "-"))
-                x_center = score_start_x + (max_innings + j) * col_width
-                
-                total_tag = f"total_{side}_{j}"
-                self.canvas.delete(total_tag)
-                self.canvas.create_rectangle(x_center - col_width // 2, y - 18, x_center + col_width // 2, y + 18,
-                                             fill=bg_col, outline="black", tags=total_tag)
-                self.canvas.create_text(x_center, y, text=val, font=self.font_team, fill=fg_col, tags=total_tag)
-
-            # extra icon cell (leave blank / will draw bat icon separately)
-            x_icon = score_start_x + (max_innings + 3) * col_width
-            icon_tag = f"icon_{side}"
-            self.canvas.delete(icon_tag)
-            self.canvas.create_rectangle(x_icon - col_width // 2, y - 18, x_icon + col_width // 2, y + 18,
-                                         fill=bg_col, outline="black", tags=icon_tag)
-
-        y_away = top_margin + row_height
-        y_home = y_away + row_height
-        draw_team_row(y_away, away, "away", active_inning_idx)
-        draw_team_row(y_home, home, "home", active_inning_idx)
-
-        # Diamond bases (dynamic part)
-        self.canvas.delete("diamond_bases")
-        inset = self.diamond_ds * 0.6
-        self.base_positions = {"2B": (self.diamond_cx, self.diamond_cy - inset),
-                              "1B": (self.diamond_cx + inset, self.diamond_cy),
-                              "3B": (self.diamond_cx - inset, self.diamond_cy),
-                              "Home": (self.diamond_cx, self.diamond_cy + inset)}
+                x_center = col_x[max_innings + j]
+                key = f"total_{side}_{j}"
+                c.create_rectangle(col_x1[max_innings + j], y - 18, col_x2[max_innings + j], y + 18,
+                                   fill=bg_col, outline="black", tags="layout")
+                row_texts.append(c.create_text(x_center, y, text="-", font=self.font_team, fill=fg_col,
+                                               tags=("layout", key)))
+
+            c.create_rectangle(col_x1[max_innings + 3], y - 18, col_x2[max_innings + 3], y + 18,
+                               fill=bg_col, outline="black", tags="layout")
+
+        # A single bat icon glyph, laid out once and moved between the two rows
+        x_icon = col_x[max_innings + 3]
+        self._icon_pos = {"away": (x_icon, y_away), "home": (x_icon, y_home)}
+        self._add_item("bat_icon", c.create_text(x_icon, y_away, text="⚾", font=self.font_team, fill=self.accent,
+                                                 state="hidden", tags=("layout", "bat_icon")))
+
+        # Bases (fill reconfigured per render)
         base_half = 18
         for bname, (bx, by) in self.base_positions.items():
             if bname == "Home":
                 # Home plate is static in this design
                 continue
-            
-            b = self.bases.get(bname, {"occupied": False, "team": None, "anim": None})
-            fill = self.empty_base_fill
-            anim = b.get("anim")
-            
-            if anim and not anim.get("finished"):
-                # Use animated color
-                fill = anim.get("current", self.empty_base_fill)
-            elif b.get("occupied"):
-                # Use occupied color (primary team color)
-                fill = team_color_for(b["team"])[0] if b["team"] else self.accent
-            
             pts = [bx, by - base_half, bx + base_half, by, bx, by + base_half, bx - base_half, by]
-            self.canvas.create_polygon(pts, fill=fill, outline="white", width=2, tags="diamond_bases")
-            self.canvas.create_text(bx, by, text=bname, font=self.font_small, fill=self.fg, tags="diamond_bases")
-
-        # Bat icon (cleared and redrawn inside draw_team_row, just need the final placement)
-        batting_team = None
-        if self.live_feed:
-            ls = self.live_feed.get("liveData", {}).get("linescore", {}) or {}
-            inning_half = ls.get("inningHalf") or None
-            if inning_half:
-                if str(inning_half).lower() == "top":
-                    batting_team = away
-                elif str(inning_half).lower() == "bottom":
-                    batting_team = home
-        
-        if batting_team:
-            icon = "⚾"
-            x_icon = score_start_x + (max_innings + 3) * col_width
-            if batting_team == away:
-                y_icon = y_away
-                icon_tag = "icon_away"
-            else:
-                y_icon = y_home
-                icon_tag = "icon_home"
-                
-            self.canvas.create_text(x_icon, y_icon, text=icon, font=self.font_team, fill=self.accent, tags=icon_tag)
+            self._add_item(f"base_{bname}", c.create_polygon(pts, fill=self.empty_base_fill, outline="white", width=2,
+                                                             tags=("layout", "diamond_bases")))
+            c.create_text(bx, by, text=bname, font=self.font_small, fill=self.fg, tags=("layout", "diamond_bases"))
 
         # B/S/O to the right of the diamond
-        self.canvas.delete("bso_group")
-        
         bso_x = self.diamond_cx + self.diamond_ds + 120
-        balls = strikes = outs = None
-        raw_balls = raw_strikes = raw_outs = 0
-        
-        # Pull B/S/O from instance state, which is updated by fetch_and_schedule
-        balls = self.balls
-        strikes = self.strikes
-        outs = self.outs
-
-        def bso_color(kind, value):
-            if value is None:
-                return "#7f8c8d"
-            if kind == "outs":
-                if 1 <= value <= 2:
-                    return "#e74c3c"
-                return "#00a651" if value == 0 else "#2c3e50"
-            if kind == "balls":
-                if value == 3:
-                    return "#e74c3c"
-            if kind == "strikes":
-                if value == 2:
-                    return "#e74c3c"
-            return "#f1c40f" if value > 0 else "#00a651"
-
         dot_r = 8
         spacing = 28
         top_of_bso = self.diamond_cy - spacing
-        
-        self.canvas.create_text(bso_x, top_of_bso - spacing, text="BALLS", font=self.font_small, fill=self.fg, anchor="w", tags="bso_group")
-        for i in range(3):
-            cx_dot = bso_x + 70 + i * (dot_r * 2 + 6)
-            fill_c = bso_color("balls", balls) if balls is not None and i < balls else "#2c3e50"
-            self.canvas.create_oval(cx_dot - dot_r, top_of_bso - spacing - dot_r, cx_dot + dot_r, top_of_bso - spacing + dot_r,
-                                    fill=fill_c, outline="white", tags="bso_group")
-        
-        self.canvas.create_text(bso_x, top_of_bso + spacing, text="STRIKES", font=self.font_small, fill=self.fg, anchor="w", tags="bso_group")
-        for i in range(2):
-            cx_dot = bso_x + 70 + i * (dot_r * 2 + 6)
-            fill_c = bso_color("strikes", strikes) if strikes is not None and i < strikes else "#2c3e50"
-            self.canvas.create_oval(cx_dot - dot_r, top_of_bso + spacing - dot_r, cx_dot + dot_r, top_of_bso + spacing + dot_r,
-                                    fill=fill_c, outline="white", tags="bso_group")
-        
-        self.canvas.create_text(bso_x, top_of_bso + spacing * 3, text="OUTS", font=self.font_small, fill=self.fg, anchor="w", tags="bso_group")
-        # draw only two outs visually
-        for i in range(2):
-            cx_dot = bso_x + 70 + i * (dot_r * 2 + 6)
-            fill_c = bso_color("outs", outs) if outs is not None and i < outs else "#2c3e50"
-            self.canvas.create_oval(
-                cx_dot - dot_r, top_of_bso + spacing * 3 - dot_r,
-                cx_dot + dot_r, top_of_bso + spacing * 3 + dot_r,
-                fill=fill_c, outline="white", tags="bso_group"
-            )
+
+        for kind, label, count, row in BSO_ROWS:
+            y = top_of_bso + spacing * row
+            c.create_text(bso_x, y, text=label, font=self.font_small, fill=self.fg, anchor="w", tags=("layout", "bso_group"))
+            for i in range(count):
+                cx_dot = bso_x + 70 + i * (dot_r * 2 + 6)
+                self._add_item(f"bso_{kind}_{i}", c.create_oval(cx_dot - dot_r, y - dot_r, cx_dot + dot_r, y + dot_r,
+                                                                fill="#2c3e50", outline="white", tags=("layout", "bso_group")))
 
         # Player/Pitcher names
         pb_x = bso_x
         pb_y = top_of_bso + spacing * 5
-        self.canvas.create_text(pb_x, pb_y, text=self.current_pitcher, font=self.font_small, fill=self.fg, anchor="w", tags="bso_group")
-        self.canvas.create_text(pb_x, pb_y + 18, text=self.current_batter, font=self.font_small, fill=self.fg, anchor="w", tags="bso_group")
+        self._add_item("pitcher", c.create_text(pb_x, pb_y, text="", font=self.font_small, fill=self.fg, anchor="w", tags=("layout", "pitcher")))
+        self._add_item("batter", c.create_text(pb_x, pb_y + 18, text="", font=self.font_small, fill=self.fg, anchor="w", tags=("layout", "batter")))
 
-        # Footer
+        # Footer (LIVE marker shown/hidden per render)
         footer_y = self.height - 24
-        is_live_now = False
-        
-        # Format the time display for the footer
-        time_display = self.format_seconds_to_dhms_string(self.next_update_in)
-        
-        if self.live_feed:
-            state = self.live_feed.get("gameData", {}).get("status", {}).get("detailedState", "") or ""
-            if "In Progress" in state or "Live" in state:
-                is_live_now = True
-                
-        if is_live_now:
-            r = 6
-            cx = 120
-            cy = footer_y
-            self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill="red", outline="", tags="footer")
-            self.canvas.create_text(cx + 14, cy, text="LIVE", font=self.font_small, fill="red", anchor="w", tags="footer")
-            footer_text = f"Next update in: {time_display}"
+        r = 6
+        cx = 120
+        self._add_item("live_dot", c.create_oval(cx - r, footer_y - r, cx + r, footer_y + r, fill="red", outline="",
+                                                 state="hidden", tags=("layout", "footer")))
+        self._add_item("live_label", c.create_text(cx + 14, footer_y, text="LIVE", font=self.font_small, fill="red", anchor="w",
+                                                   state="hidden", tags=("layout", "footer")))
+        self._add_item("footer", c.create_text(self.width // 2, footer_y, text="", font=self.font_small, fill=self.fg,
+                                               tags=("layout", "footer")))
+
+        # Keep runner icons above the freshly created layout
+        c.tag_raise("runner")
+
+    def render(self, full=False):
+        """Main rendering function (must be called on main thread).
+
+        The static layout is rebuilt only when max_innings or the teams change
+        (or full=True); otherwise only changed item values are pushed to the canvas.
+        """
+        if threading.current_thread() != threading.main_thread():
+            self.log("render() called from non-main thread!", level="error")
+            return
+
+        # Nothing to paint while minimized/unmapped; <Map> or the next tick replays it on restore
+        if self.root.state() == "iconic" or not self.canvas.winfo_viewable():
+            self._render_skipped = True
+            return
+        self._render_skipped = False
+
+        model = self._render_model
+        layout_key = (model["max_innings"], model["away_name"], model["home_name"]) if model else None
+        if full or not self._items or layout_key != self._layout_key:
+            self.build_layout(model)
+            self._layout_key = layout_key
+
+        if not model:
+            self._config("waiting_msg", text=f"Waiting for game data for {self.followed_team_name}")
+            self._config("footer", text=self.footer_text(model))
+            return
+
+        max_innings = model["max_innings"]
+        # Get current inning index for highlighting
+        active_inning_idx = model["active_inning_idx"]
+
+        # Highlight active inning header
+        for i in range(max_innings):
+            if i == active_inning_idx:
+                self._config(f"inning_header_{i}_bg", fill=self.header_active_bg)
+                self._config(f"inning_header_{i}", fill=self.fg)
+            else:
+                self._config(f"inning_header_{i}_bg", fill=self.bg)
+                self._config(f"inning_header_{i}", fill=self.accent)
+
+        # Per-inning cell fills, then one flat pass over the row values (innings + R/H/E)
+        for side in ("away", "home"):
+            bg_col = model[f"{side}_bg"]
+            active_bg = model[f"{side}_active_bg"]
+            for i, (rect_id, _) in enumerate(self.cell_ids[side]):
+                self._config_id(rect_id, fill=active_bg if i == active_inning_idx else bg_col)
+            for text_id, val in zip(self.text_ids[side], model[f"{side}_vals"]):
+                self._config_id(text_id, text=val)
+
+        # Bat icon: move it only when the batting side changes, hide it otherwise
+        pos = self._icon_pos.get(model["batting_side"])
+        if pos:
+            icon_id = self._items["bat_icon"]
+            if self._drawn.get((icon_id, "coords")) != pos:
+                self._drawn[(icon_id, "coords")] = pos
+                self.canvas.coords(icon_id, *pos)
+            self._config("bat_icon", state="normal")
         else:
-            if self.next_game and "gameDate_dt" in self.next_game:
-                dt = self.next_game["gameDate_dt"].astimezone()
-                away_n = get_team_name(self.next_game["teams"]["away"])
-                home_n = get_team_name(self.next_game["teams"]["home"])
-                try:
-                    footer_text = f"Next: {away_n} @ {home_n} {dt.strftime('%a %b %d, %I:%M %p %Z')} | Next update in: {time_display}"
-                except Exception:
-                    footer_text = f"Next: {away_n} @ {home_n} | Next update in: {time_display}"
+            self._config("bat_icon", state="hidden")
+
+        # Diamond bases (dynamic fill)
+        for bname, b in self.bases.items():
+            anim = b["anim"]
+            if anim and not anim["finished"]:
+                # Use animated color
+                fill = anim["current"]
+            elif b["occupied"]:
+                # Use occupied color (primary team color)
+                fill = team_color_for(b["team"])[0] if b["team"] else self.accent
             else:
-                footer_text = f"Waiting for game data for {self.followed_team_name} | Next update in: {time_display}"
-        
-        self.canvas.create_text(self.width // 2, footer_y, text=footer_text, font=self.font_small, fill=self.fg, tags="footer")
+                fill = self.empty_base_fill
+            self._config(f"base_{bname}", fill=fill)
+
+        # B/S/O dots (pulled from the render model, rebuilt by fetch_and_schedule)
+        for kind, _, count, _ in BSO_ROWS:
+            value = model[kind[0]]
+            lit = bso_color(kind, value) if value else "#2c3e50"
+            for i in range(count):
+                self._config(f"bso_{kind}_{i}", fill=lit if value is not None and i < value else "#2c3e50")
+
+        # Player/Pitcher names
+        self._config("pitcher", text=model["pitcher"])
+        self._config("batter", text=model["batter"])
+
+        # Footer
+        live_state = "normal" if model["is_live"] else "hidden"
+        self._config("live_dot", state=live_state)
+        self._config("live_label", state=live_state)
+
+        self._config("footer", text=self.footer_text(model))
+
+    def footer_text(self, model):
+        """Builds the footer line (countdown plus live/next-game context) for a render model."""
+        # Format the time display for the footer
+        time_display = self.format_seconds_to_dhms_string(self.next_update_in)
+
+        if model:
+            return f"{model['footer_prefix']}Next update in: {time_display}"
+        return f"Waiting for game data for {self.followed_team_name} | Next update in: {time_display}"
 
+    def tick_footer(self):
+        """Pushes just the footer countdown (main thread); full renders stay event-driven."""
+        if not self._items or self._dirty:
+            # No layout yet, or a full render is already queued and will cover the footer
+            self._request_redraw()
+            return
+        if self.root.state() == "iconic" or not self.canvas.winfo_viewable():
+            return
+        if self._render_skipped:
+            # Restored after renders were skipped: the whole board is stale, not just the footer
+            self._request_redraw()
+            return
+        self._config("footer", text=self.footer_text(self._render_model))
 
-    def start_fade(self, base_key, team_color, duration_ms=600, steps=8):
+    def start_fade(self, base_key, team_color, duration_ms=600):
         """Starts a base fade animation (Must be called on main thread)."""
         if threading.current_thread() != threading.main_thread():
-             self.root.after(0, lambda: self.start_fade(base_key, team_color, duration_ms, steps))
+             self.root.after(0, lambda: self.start_fade(base_key, team_color, duration_ms))
              return
         
         start = self.empty_base_fill
         end = team_color or self.accent
-        step_ms = max(20, int(duration_ms / steps))
+        steps = max(1, duration_ms // FADE_TICK_MS)
         
         # Reset animation state if starting a new one
         if base_key not in self.bases:
             self.bases[base_key] = {"occupied": False, "team": None, "anim": None}
             
-        anim = {"step": 0, "steps": steps, "start": start, "end": end, "current": start, "finished": False}
+        # The whole color ramp is computed up front; each step is then a lookup
+        start_rgb = hex_to_rgb(start)
+        end_rgb = hex_to_rgb(end)
+        frames = [blend_rgb(start_rgb, end_rgb, s / float(steps)) for s in range(steps + 1)]
+        anim = {"step": 0, "steps": steps, "start": start, "end": end, "current": start, "finished": False,
+                "frames": frames}
+        # Replacing the base's anim supersedes any fade already running there
         self.bases[base_key]["anim"] = anim
 
-        def _step():
-            if base_key not in self.bases or not self.bases[base_key]["anim"]:
-                # Animation cancelled (e.g., 3rd out reset)
-                return
+        if self._fade_after is None:
+            self._fade_after = self.root.after(0, self._fade_tick)
 
-            s = anim["step"]
-            t = s / float(anim["steps"])
-            anim["current"] = blend_colors(anim["start"], anim["end"], t)
-            
-            # Partial render to update the base color
-            self.render(full=False) 
-            anim["step"] += 1
-            
-            if anim["step"] <= anim["steps"]:
-                self.root.after(step_ms, _step)
-            else:
-                anim["finished"] = True
-                anim["current"] = anim["end"]
-                self.render(full=False)
-
-        self.root.after(0, _step)
+    def _fade_tick(self):
+        """Advances every running base fade by one frame; reschedules itself while any remain."""
+        try:
+            for base_key, b in self.bases.items():
+                anim = b["anim"]
+                if not anim or anim["finished"]:
+                    continue
+                if anim["step"] <= anim["steps"]:
+                    anim["current"] = anim["frames"][anim["step"]]
+                    anim["step"] += 1
+                else:
+                    anim["finished"] = True
+                    anim["current"] = anim["end"]
+                # Recolor just the base polygon instead of running a render pass
+                self._config(f"base_{base_key}", fill=anim["current"])
+        finally:
+            # Always reschedule or clear the ticker, even if a recolor raised, so
+            # later start_fade calls are never left waiting on a dead chain
+            active = any(b["anim"] and not b["anim"]["finished"] for b in self.bases.values())
+            self._fade_after = self.root.after(FADE_TICK_MS, self._fade_tick) if active else None
 
     def update_loop(self):
         """Main loop that controls polling timing and schedules fetch."""
         
+        # Countdown derived from a monotonic deadline so Tk tick jitter can't accumulate
+        self.next_update_in = max(0, math.ceil(self._deadline - time.monotonic()))
+
+        # A fetch that raised is reported once, then retried at the live poll rate
+        fut = self._fetch_future
+        if fut is not None and fut.done() and fut.exception() is not None:
+            exc = fut.exception()
+            self.log(f"fetch_and_schedule failed: {exc!r}", level="error")
+            if self.debug:
+                traceback.print_exception(type(exc), exc, exc.__traceback__)
+            self._fetch_future = None
+            retry_in = self._poll_live
+            self._deadline = time.monotonic() + retry_in
+            self.next_update_in = retry_in
+
         # Using executor.submit to manage the thread
-        if self.next_update_in <= 0 and not self.running_fetch:
-            self.running_fetch = True # Flag set before submission
+        if self.next_update_in <= 0 and not self.fetch_in_progress():
             # Submit to ThreadPoolExecutor
-            self.executor.submit(self.fetch_and_schedule)
-            
-        if self.next_update_in > 0:
-            self.next_update_in -= 1
+            self._fetch_future = self.executor.submit(self.fetch_and_schedule)
         
         # only log B/S/O changes to avoid per-second spam
         current_state = (self.balls, self.strikes, self.outs)
@@ -963,252 +1423,242 @@ class ScoreboardApp:
             self.log(f"State counts — B:{self.balls} S:{self.strikes} O:{self.outs}", verbose=True)
             self._last_log_state = current_state
             
-        # Partial render for base fade animation and footer update
-        self.render(full=False)
-        self.root.after(1000, self.update_loop)
+        # Only the countdown changes on a plain tick; data/animation changes request renders
+        self.tick_footer()
+        self.schedule_update_loop(1000)
+
+    def schedule_update_loop(self, delay_ms):
+        """(Re)arms update_loop, cancelling any pending call so two chains never run."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(delay_ms, self.update_loop)
+
+    def stop_update_loop(self):
+        """Cancels the pending update_loop call (e.g. on shutdown)."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def fetch_in_progress(self):
+        """True while a submitted fetch_and_schedule has not finished."""
+        return self._fetch_future is not None and not self._fetch_future.done()
 
     def fetch_and_schedule(self):
         """Fetches game data, updates state, and schedules GUI updates (Runs in background thread)."""
         # This function runs in a background thread
-        try:
-            games = fetch_schedule(self.team_id)
-            self.games = games
-            now_utc = datetime.datetime.now(datetime.timezone.utc)
-            live_game = None
-            last_game = None
-            next_game = None
-            
-            for g in games:
-                gd = g.get("gameDate_dt")
-                state = g.get("status", {}).get("detailedState", "") or ""
-                
-                # Find the most recent "finished" game
-                if gd and state in ("Final", "Game Over") and gd.astimezone(datetime.timezone.utc) <= now_utc:
-                    last_game = g
-                # Identify the single currently live game
-                if state == "In Progress":
-                    live_game = g
-                    
-                # Find the *next* scheduled game (since games are sorted, first match is the next)
-                if gd and gd.astimezone(datetime.timezone.utc) >= now_utc and not next_game:
-                    # Ignore a game that's just started as 'next' if we have a live game
-                    if live_game and live_game["gamePk"] == g["gamePk"]:
-                        continue
-                    next_game = g
-
-            self.last_game = last_game
-            self.next_game = next_game
-            self.live_game = live_game
-
-            if self.next_game and "gameDate_dt" in self.next_game:
-                try:
-                    self.next_game["gameDate_dt"] = self.next_game["gameDate_dt"].astimezone()
-                except Exception:
-                    pass
-
-            chosen = live_game or last_game
-            prev_base_runners = {k: (self.bases[k]["occupied"], self.bases[k]["team"]) for k in self.bases}
-            
-            feed = None
-            if chosen:
-                feed = fetch_live_feed(chosen.get("gamePk"))
-                self.live_feed = feed
-                record_live_feed(feed, chosen, full=RECORD_FULL_PATH is not None)
-                record_live_feed(feed, chosen, full=False)
+        # Speculatively fetch the last polled game's feed on the second worker while the
+        # schedule downloads, so a poll costs max(schedule, feed) instead of their sum
+        spec_pk = self._last_live_pk
+        feed_future = None
+        if spec_pk and self.live_feed is not None:
+            feed_future = self.executor.submit(fetch_live_feed, spec_pk, LIVE_FEED_FIELDS)
+
+        # While a game is live its linescore comes from /feed/live, so skip hydrating it here
+        games = fetch_schedule(self.team_id, hydrate="team" if self.live_game else "team,linescore")
+        self.games = games
+        now_ts = time.time()
+        live_game, last_game, next_game = classify_games(games, now_ts)
+
+        self.last_game = last_game
+        self.next_game = next_game
+        self.live_game = live_game
+
+        chosen = live_game or last_game
+        
+        feed = None
+        prev_feed = self.live_feed
+        if chosen:
+            pk = chosen.get("gamePk")
+            if feed_future is not None and pk == spec_pk:
+                feed = feed_future.result()
             else:
-                self.live_feed = None
-
-            if self.live_feed:
-                # --- State Extraction and 3rd Out Logic (Thread-safe assignment) ---
-                raw_balls = 0
-                raw_strikes = 0
-                raw_outs = 0
-                try:
-                    current_play = self.live_feed.get("liveData", {}).get("plays", {}).get("currentPlay", {}) or {}
-                    counts = current_play.get("count", {}) or {}
-                    raw_balls = int(counts.get("balls", 0))
-                    raw_strikes = int(counts.get("strikes", 0))
-                except Exception:
-                    pass
-                try:
-                    raw_outs = int(self.live_feed.get("liveData", {}).get("linescore", {}).get("outs", 0))
-                except Exception:
-                    pass
-                    
-                ls_hdr = self.live_feed.get("liveData", {}).get("linescore", {}) or {}
-                curr_inning = ls_hdr.get("currentInning")
-                curr_half = ls_hdr.get("inningHalf")
-                
-                # Inning/Half Change Detection
-                if (curr_inning, curr_half) != (self._last_inning, self._last_inning_half):
-                    self._inning_reset_done = False
-                    self._last_inning = curr_inning
-                    self._last_inning_half = curr_half
-
-                if raw_outs >= 3 and not self._inning_reset_done:
-                    # 3rd out detected: Trigger immediate base reset and set BSO to 0
-                    self.log("Third out detected — triggering counts/bases reset.", verbose=True)
-                    self.root.after(0, self.reset_after_third_out) # Schedule GUI reset
-                    
-                    # Update internal state immediately for BSO display in the next render
-                    self.balls = 0
-                    self.strikes = 0
-                    self.outs = 0
-                    self._inning_reset_done = True
-                else:
-                    # Cleaned up BSO assignment to max/min
-                    self.balls = max(0, min(3, raw_balls))
-                    self.strikes = max(0, min(2, raw_strikes))
-                    self.outs = max(0, min(2, raw_outs))
-                
-                # --- Player Names ---
-                try:
-                    current_play = self.live_feed.get("liveData", {}).get("plays", {}).get("currentPlay", {}) or {}
-                    matchup = current_play.get("matchup", {}) or {}
-                    batter = matchup.get("batter", {}).get("fullName")
-                    pitcher = matchup.get("pitcher", {}).get("fullName")
-                    self.current_batter = f"Batter: {batter}" if batter else "Batter: -"
-                    self.current_pitcher = f"Pitcher: {pitcher}" if pitcher else "Pitcher: -"
-                except Exception:
-                    self.current_batter = "Batter: -"
-                    self.current_pitcher = "Pitcher: -"
-                
-                # --- Runner/Base Logic ---
-                
-                # 1. Reset base state (in the current thread)
-                for k in self.bases:
-                    self.bases[k]["occupied"] = False
-                    self.bases[k]["team"] = None
-
-                # 2. Update occupancy from linescore (source of truth for base fill)
-                try:
-                    ls_off = self.live_feed.get("liveData", {}).get("linescore", {}).get("offense", {}) or {}
-                    for key, bkey in (("first", "1B"), ("second", "2B"), ("third", "3B")):
-                        ent = ls_off.get(key)
-                        if ent:
-                            self.bases[bkey]["occupied"] = True
-                            t = ent.get("team") or {}
-                            self.bases[bkey]["team"] = t.get("name") if isinstance(t, dict) else t
-                except Exception:
-                    if DEBUG:
-                        print("[DEBUG] Error processing linescore.offense for base occupancy.", threading.get_ident())
-                
-                # 3. Check occupancy changes to trigger base fade/runner spawn
-                for b in ("1B", "2B", "3B"):
-                    was_occ, was_team = prev_base_runners[b]
-                    now_occ = self.bases[b]["occupied"]
-                    now_team = self.bases[b]["team"]
-                    
-                    if now_occ and not was_occ:
-                        # Runner appeared: trigger base fade and ensure a static runner icon exists
-                        team_col = team_color_for(now_team)[0] if now_team else self.accent # Primary for base fill
-                        runner_col = team_color_for(now_team)[1] if now_team else self.accent # Accent for runner icon
-                        
-                        # Schedule fade animation and runner spawn on the main thread
-                        self.root.after(0, lambda b=b, c=team_col: self.start_fade(b, c))
-                        if b not in self.runners_by_base:
-                             self.root.after(0, lambda b=b, c=runner_col: self.spawn_runner_at_base(b, color=c))
-                             
-                    if not now_occ and was_occ:
-                        # Runner disappeared: clear the runner icon on the main thread
-                        if b in self.runners_by_base:
-                            rkey = self.runners_by_base.pop(b, None)
-                            if rkey:
-                                info = self.runners.pop(rkey, None)
-                                # The runner move animation usually handles deletion, but this ensures cleanup
-                                if info:
-                                    self.root.after(0, lambda c=info.get("cid"): self.canvas.delete(c))
-                        # Clear base animation state
-                        self.bases[b]["anim"] = None
-
-                # 4. Process currentPlay.runners for *movement/animations*
-                try:
-                    runners_in_play = current_play.get("runners") or current_play.get("baseRunners") or []
-                    
-                    def to_key(v):
-                        if not v: return None
-                        s = str(v).lower()
-                        if "first" in s or "1b" in s or s == "1": return "1B"
-                        if "second" in s or "2b" in s or s == "2": return "2B"
-                        if "third" in s or "3b" in s or s == "3": return "3B"
-                        if "home" in s or "plate" in s: return "Home"
-                        return None
-                        
-                    for r in runners_in_play:
-                        if not isinstance(r, dict): continue
-                        
-                        team_name = (r.get("team") or {}).get("name") if isinstance(r.get("team"), dict) else r.get("team")
-                        color = team_color_for(team_name)[1] if team_name else self.accent
-                        
-                        mv = r.get("movement") or {}
-                        sk = to_key(mv.get("start"))
-                        ek = to_key(mv.get("end"))
-                        
-                        if sk and ek:
-                            # Schedule runner movement animation on the main thread
-                            self.root.after(0, lambda s=sk, e=ek, c=color: self.move_runner_base(s, e, c))
-                        elif ek and ek != "Home":
-                            # Runner appeared (e.g., batter on 1B), spawn if not there (handled by occupancy logic, but kept for redundancy)
-                            if ek not in self.runners_by_base:
-                                self.root.after(0, lambda e=ek, c=color: self.spawn_runner_at_base(e, color=c))
-
-                except Exception:
-                    if DEBUG:
-                        print("[DEBUG] Error processing currentPlay.runners for animations.", threading.get_ident())
+                # Same game as last poll: only request the fields we actually read
+                fields = LIVE_FEED_FIELDS if pk == self._last_live_pk and self.live_feed is not None else None
+                feed = fetch_live_feed(pk, fields=fields)
+            self._last_live_pk = pk if feed else None
+            self.live_feed = feed
+            record_live_feed(feed, chosen, full=RECORD_FULL_PATH is not None)
+            record_live_feed(feed, chosen, full=False)
+        else:
+            self.live_feed = None
+
+        # A 304 hands back the cached feed object itself: everything derived from it still stands
+        feed_unchanged = feed is not None and feed is prev_feed
+
+        # Base/runner changes for the Tk thread; self.bases is never touched from here
+        occupancy = None
+        moves = []
+        third_out = False
+        clear_runners = False
+
+        if self.live_feed and not feed_unchanged:
+            # --- State Extraction and 3rd Out Logic (Thread-safe assignment) ---
+            # Walk down to the two subtrees everything below reads, once
+            current_play = dig(self.live_feed, _CURRENT_PLAY) or {}
+            ls_hdr = dig(self.live_feed, _LINESCORE) or {}
+            counts = current_play.get("count", {}) or {}
+            raw_balls = int(counts.get("balls") or 0)
+            raw_strikes = int(counts.get("strikes") or 0)
+            raw_outs = int(ls_hdr.get("outs") or 0)
+
+            curr_inning = ls_hdr.get("currentInning")
+            curr_half = ls_hdr.get("inningHalf")
+            
+            # Inning/Half Change Detection
+            if (curr_inning, curr_half) != (self._last_inning, self._last_inning_half):
+                self._inning_reset_done = False
+                self._last_inning = curr_inning
+                self._last_inning_half = curr_half
+
+            if raw_outs >= 3 and not self._inning_reset_done:
+                # 3rd out detected: Trigger immediate base reset and set BSO to 0
+                self.log("Third out detected — triggering counts/bases reset.", verbose=True)
+                third_out = True # bases/runners are reset on the Tk thread
                 
-                now = time.time()
-                if now - self._last_poll_time > 5:
-                    self.log("Successfully polled feed and updated state", verbose=True)
-                    self._last_poll_time = now
-            else:
-                # No live feed - clear BSO/names/bases
-                self.current_batter = "Batter: -"
-                self.current_pitcher = "Pitcher: -"
+                # Update internal state immediately for BSO display in the next render
                 self.balls = 0
                 self.strikes = 0
                 self.outs = 0
-                for k in self.bases:
-                    self.bases[k]["occupied"] = False
-                    self.bases[k]["team"] = None
-                    self.bases[k]["anim"] = None
-                self.root.after(0, self.clear_all_runners)
-                self._inning_reset_done = False # Reset flag if game ends/switches
-
-            # --- Smart Polling Calculation ---
-            if live_game:
-                self.poll_interval = self.polling.get("live", 15)
-            elif next_game and next_game.get("gameDate_dt"):
-                dt_next = next_game["gameDate_dt"].astimezone()
-                dt_now = datetime.datetime.now(dt_next.tzinfo)
-                time_to_next = (dt_next - dt_now).total_seconds()
-
-                min_poll = self.polling.get("scheduled", 300) 
-                one_hour = 3600                             
-                
-                if time_to_next <= 0:
-                    self.poll_interval = self.polling.get("live", 15)
-                elif time_to_next > one_hour:
-                    # Wait until 1 hour before start
-                    wait_interval = max(min_poll, time_to_next - one_hour)
-                    self.poll_interval = int(wait_interval)
-                else:
-                    # 1 hour or less away: switch to scheduled poll rate (5 min default)
-                    self.poll_interval = min_poll 
-                    
-                if self.debug and self.poll_interval != self.polling.get("live", 15):
-                    self.log(f"Next game in: {self.format_seconds_to_dhms_string(time_to_next)} ({time_to_next:.0f}s). Smart poll interval set to: {self.poll_interval}s.", verbose=True)
-                    
+                self._inning_reset_done = True
             else:
-                # No next game found
-                self.poll_interval = self.polling.get("none", 3600)
-
-            self.next_update_in = self.poll_interval
+                # Cleaned up BSO assignment to max/min
+                self.balls = max(0, min(3, raw_balls))
+                self.strikes = max(0, min(2, raw_strikes))
+                self.outs = max(0, min(2, raw_outs))
             
-            # Schedule the full GUI render on the main thread
-            self.root.after(0, self.render_full_gui)
+            # --- Player Names ---
+            matchup = current_play.get("matchup", {}) or {}
+            batter = (matchup.get("batter") or {}).get("fullName")
+            pitcher = (matchup.get("pitcher") or {}).get("fullName")
+            self.current_batter = f"Batter: {batter}" if batter else "Batter: -"
+            self.current_pitcher = f"Pitcher: {pitcher}" if pitcher else "Pitcher: -"
             
-        finally:
-            self.running_fetch = False
+            # --- Runner/Base Logic ---
+            accent = self.accent
+            
+            ls_off = ls_hdr.get("offense", {}) or {}
+            runners_in_play = current_play.get("runners") or current_play.get("baseRunners") or []
+            # Fingerprint of everything the base/runner pipeline reads. Between most polls the
+            # play hasn't moved on (same batter, same runners), so the whole block is skipped.
+            play_sig = (
+                entity_id(matchup.get("batter")),
+                entity_id(matchup.get("pitcher")),
+                tuple(entity_id(ls_off.get(k)) for k in ("first", "second", "third")),
+                tuple(((r.get("movement") or {}).get("start"), (r.get("movement") or {}).get("end"))
+                      for r in runners_in_play if isinstance(r, dict)),
+            )
+            if play_sig != self._last_play_sig:
+                self._last_play_sig = play_sig
+                # 1. Occupancy from linescore.offense (source of truth for base fill); the
+                #    Tk thread diffs it against the bases to decide fades/spawns/cleanup
+                occupancy = {}
+                for key, b in (("first", "1B"), ("second", "2B"), ("third", "3B")):
+                    ent = ls_off.get(key)
+                    now_team = None
+                    if isinstance(ent, dict):
+                        t = ent.get("team") or {}
+                        now_team = t.get("name") if isinstance(t, dict) else t
+                    occupancy[b] = (bool(ent), now_team)
+
+                # 2. Process currentPlay.runners for *movement/animations*
+                for r in runners_in_play:
+                    if not isinstance(r, dict): continue
+
+                    team_name = (r.get("team") or {}).get("name") if isinstance(r.get("team"), dict) else r.get("team")
+                    color = team_color_for(team_name)[1] if team_name else accent
+
+                    mv = r.get("movement") or {}
+                    sk = to_base_key(mv.get("start"))
+                    ek = to_base_key(mv.get("end"))
+
+                    if sk and ek:
+                        # Runner movement animation
+                        moves.append((sk, ek, color))
+                    elif ek and ek != "Home":
+                        # Runner appeared (e.g., batter on 1B), spawn if not there (handled by occupancy logic, but kept for redundancy)
+                        moves.append((None, ek, color))
+
+            now = time.monotonic()
+            if now - self._last_poll_time > 5:
+                self.log("Successfully polled feed and updated state", verbose=True)
+                self._last_poll_time = now
+        elif not self.live_feed:
+            # No live feed - clear BSO/names/bases
+            self.current_batter = "Batter: -"
+            self.current_pitcher = "Pitcher: -"
+            self.balls = 0
+            self.strikes = 0
+            self.outs = 0
+            occupancy = {k: (False, None) for k in ("1B", "2B", "3B")}
+            clear_runners = True
+            self._inning_reset_done = False # Reset flag if game ends/switches
+            self._last_play_sig = None
+
+        # --- Smart Polling Calculation ---
+        if live_game:
+            self.poll_interval = self._poll_live
+        else:
+            self.poll_interval = smart_poll_interval(next_game, now_ts, self._poll_live,
+                                                     self._poll_scheduled, self._poll_none)
+            if self.debug and next_game and next_game.get("_gd_utc_ts") is not None and self.poll_interval != self._poll_live:
+                time_to_next = next_game["_gd_utc_ts"] - now_ts
+                self.log(f"Next game in: {self.format_seconds_to_dhms_string(time_to_next)} ({time_to_next:.0f}s). Smart poll interval set to: {self.poll_interval}s.", verbose=True)
+
+        self.next_update_in = self.poll_interval
+        self._deadline = time.monotonic() + self.poll_interval
+        
+        # Hand the snapshot to the main thread; only it touches the canvas and the bases
+        self.root.after(0, self._apply_poll_result, self.build_render_model(),
+                        occupancy, moves, third_out, clear_runners)
+
+    def _apply_poll_result(self, model, occupancy, moves, third_out, clear_runners):
+        """Applies a poll's base/runner changes, then publishes its render model (main thread).
+
+        occupancy is {base: (occupied, team)} for 1B/2B/3B, or None when the play
+        hasn't moved on since the last poll; moves are (start or None, end, color).
+        """
+        if third_out:
+            # Bases/runners are wiped; offense and movements from the same poll are stale
+            self.reset_after_third_out()
+        else:
+            if occupancy is not None:
+                accent = self.accent
+                for b, (now_occ, now_team) in occupancy.items():
+                    base = self.bases[b]
+                    was_occ = base["occupied"]
+                    base["occupied"] = now_occ
+                    base["team"] = now_team
+                    if now_occ and not was_occ:
+                        # Runner appeared: fade the base in (primary) and show a runner icon (accent)
+                        team_col, runner_col = team_color_for(now_team) if now_team else (accent, accent)
+                        self.start_fade(b, team_col)
+                        self.spawn_runner_at_base(b, color=runner_col)
+                    elif was_occ and not now_occ:
+                        self.clear_runner_at_base(b)
+            for sk, ek, color in moves:
+                if sk:
+                    self.move_runner_base(sk, ek, color)
+                else:
+                    self.spawn_runner_at_base(ek, color=color)
+            if clear_runners:
+                self.clear_all_runners()
+
+        if model is not None:
+            # occupancy snapshot so a base change alone still counts as a model change
+            model["bases"] = tuple((k, b["occupied"], b["team"]) for k, b in self.bases.items())
+        self._apply_fetch_result(model)
+        
+
+    def _apply_fetch_result(self, model):
+        """Publishes a freshly built render model and queues a redraw (main thread).
+
+        A poll that produced the same model as the one on screen skips the
+        render pass entirely.
+        """
+        if model == self._render_model and self._items:
+            return
+        self._render_model = model
+        self._request_redraw()
 
     def reset_after_third_out(self):
         """Resets all bases, runners, and clears animation state (Must be called on main thread)."""
@@ -1235,11 +1685,12 @@ def main():
     def sigint_handler(signum, frame):
         """Handles SIGINT (Ctrl+C) for clean exit."""
         print("\n\n[INFO] Caught Ctrl+C. Shutting down gracefully...")
-        # Check app.running_fetch state before quitting
-        if app.running_fetch:
+        # Check for an in-flight fetch before quitting
+        if app.fetch_in_progress():
             print("[INFO] Waiting for ongoing fetch thread to finish...")
         
-        # Shutdown the executor to prevent new tasks
+        # Stop the 1s loop and shutdown the executor to prevent new tasks
+        app.stop_update_loop()
         app.executor.shutdown(wait=False)
         root.quit()
 
@@ -0,0 +1,61 @@
+"""Schedule classification and smart-poll interval tests (python -m unittest)."""
+import pathlib
+import sys
+import unittest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# mlbscore parses the command line on import
+sys.argv = ["mlbscore.py", "--config", str(ROOT / "config.json")]
+import mlbscore  # noqa: E402
+
+NOW = 1_700_000_000.0
+LIVE, SCHEDULED, NONE = 15, 300, 3600
+
+
+def game(pk, state, offset):
+    return {"gamePk": pk, "status": {"detailedState": state}, "_gd_utc_ts": NOW + offset}
+
+
+def poll_for(next_game):
+    return mlbscore.smart_poll_interval(next_game, NOW, LIVE, SCHEDULED, NONE)
+
+
+class ClassifyGamesTest(unittest.TestCase):
+    def test_pending_start_game_in_the_past_stays_next(self):
+        for state in ("Warmup", "Pre-Game", "Delayed Start: Rain", "Scheduled"):
+            with self.subTest(state=state):
+                pending = game(2, state, -5)
+                tomorrow = game(3, "Scheduled", 86400)
+                live, last, nxt = mlbscore.classify_games([game(1, "Final", -86400), pending, tomorrow], NOW)
+                self.assertIsNone(live)
+                self.assertEqual(last["gamePk"], 1)
+                self.assertIs(nxt, pending)
+                self.assertEqual(poll_for(nxt), LIVE)
+
+    def test_postponed_game_in_the_past_is_skipped(self):
+        tomorrow = game(3, "Scheduled", 86400)
+        _, _, nxt = mlbscore.classify_games([game(2, "Postponed: Rain", -5), tomorrow], NOW)
+        self.assertIs(nxt, tomorrow)
+
+    def test_in_progress_game_is_live(self):
+        live_g = game(2, "In Progress", -600)
+        live, _, _ = mlbscore.classify_games([game(1, "Final", -86400), live_g], NOW)
+        self.assertIs(live, live_g)
+
+
+class SmartPollIntervalTest(unittest.TestCase):
+    def test_far_game_waits_until_one_hour_out(self):
+        self.assertEqual(poll_for(game(1, "Scheduled", 7200)), 3600)
+
+    def test_near_game_halves_remaining_time(self):
+        self.assertEqual(poll_for(game(1, "Scheduled", 3000)), SCHEDULED)
+        self.assertEqual(poll_for(game(1, "Scheduled", 180)), 90)
+        self.assertEqual(poll_for(game(1, "Scheduled", 10)), LIVE)
+
+    def test_no_next_game(self):
+        self.assertEqual(poll_for(None), NONE)
+
+
+if __name__ == "__main__":
+    unittest.main()